@@ -39,15 +39,20 @@ if (Test-Path $DistDir) { Remove-Item -Recurse -Force $DistDir }
 if (Test-Path $BuildDir) { Remove-Item -Recurse -Force $BuildDir }
 
 # Run PyInstaller
-Write-Host "Building executable with PyInstaller..."
 Set-Location $ScriptDir
 
+Write-Host "Pre-rendering tray icons..."
+python build_icons.py
+
+Write-Host "Building executable with PyInstaller..."
+
 pyinstaller `
     --name $AppName `
     --onefile `
     --windowed `
     --noconfirm `
     --clean `
+    --add-data "faker_app\resources;faker_app\resources" `
     --hidden-import=PyQt6 `
     --hidden-import=PyQt6.QtCore `
     --hidden-import=PyQt6.QtGui `
@@ -39,15 +39,20 @@ echo "Cleaning previous builds..."
 rm -rf "$DIST_DIR" "$BUILD_DIR"
 
 # Run PyInstaller
-echo "Building executable with PyInstaller..."
 cd "$SCRIPT_DIR"
 
+echo "Pre-rendering tray icons..."
+python build_icons.py
+
+echo "Building executable with PyInstaller..."
+
 pyinstaller \
     --name "$APP_NAME" \
     --onefile \
     --windowed \
     --noconfirm \
     --clean \
+    --add-data "faker_app/resources:faker_app/resources" \
     --hidden-import=PyQt6 \
     --hidden-import=PyQt6.QtCore \
     --hidden-import=PyQt6.QtGui \
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Pre-render the tray icons into faker_app/utils/_icon_data.py.
+
+Run by the build scripts before PyInstaller so the packaged app decodes
+the icons from PNG data instead of painting them with QPainter/QFont.
+Rendering happens on the build machine, so the glyph uses the same fonts
+the runtime painter would.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+if sys.platform.startswith("linux") and not (
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QBuffer, QIODevice
+from PyQt6.QtGui import QGuiApplication
+
+from faker_app.utils.icon import PRERENDERED_SIZE, _paint_tray_pixmap
+
+OUTPUT = Path(__file__).resolve().parent / "faker_app" / "utils" / "_icon_data.py"
+
+
+def main():
+    app = QGuiApplication(sys.argv)  # noqa: F841 - required for QPixmap
+
+    lines = [
+        '"""Pre-rendered tray icons. Generated by build_icons.py; do not edit."""',
+        "",
+        "ICON_BYTES = {",
+    ]
+    for active in (False, True):
+        for dark_mode in (False, True):
+            buf = QBuffer()
+            buf.open(QIODevice.OpenModeFlag.WriteOnly)
+            _paint_tray_pixmap(active, dark_mode, PRERENDERED_SIZE).save(buf, "PNG")
+            lines.append(f"    ({active}, {dark_mode}): {bytes(buf.data())!r},")
+    lines.append("}")
+
+    OUTPUT.write_text("\n".join(lines) + "\n")
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 """Main application with system tray for Faker."""
 
+import threading
+import time
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QSystemTrayIcon,
     QMenu,
     QApplication,
-    QMessageBox,
 )
-from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer
 from PyQt6.QtGui import QAction
 
 from .methods import (
@@ -15,26 +18,57 @@ from .methods import (
     move_mouse_random,
     toggle_scroll_lock,
     reset_idle_timer,
+    set_keep_awake,
     check_requirements,
+    set_linux_backend,
     METHODS,
 )
-from .options import OptionsDialog
-from .utils.config import load_config, save_config
+from .utils.config import load_config, save_config, save_config_async
 from .utils.icon import generate_tray_icon
-from .utils.theme import ThemeManager
+from .utils import theme
+
+
+class _ActivityJob(QRunnable):
+    """Runs one activity simulation call on a worker thread."""
+
+    def __init__(self, fn, busy: threading.Lock):
+        super().__init__()
+        self._fn = fn
+        self._busy = busy
+
+    def run(self):
+        try:
+            self._fn()
+        finally:
+            self._busy.release()
 
 
 class FakerApp(QObject):
     """System tray application for simulating user activity."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
 
         self._config = load_config()
+        set_linux_backend(self._config.get("linux_backend", "xdo"))
+        # Saves are debounced, so flush on every exit path (tray Exit,
+        # session logout, quit() from elsewhere), not just the menu item
+        QApplication.instance().aboutToQuit.connect(self._save_on_quit)
         self._active = False
+        # True while idle_reset is served by an OS-level keep-awake hold
+        self._keeping_awake = False
+        self._interval = self._config.get("interval_seconds", 60)
+        self._last_fire = 0.0
+        # Held while an activity job is running on the thread pool
+        self._activity_busy = threading.Lock()
+        self._options_dialog = None
+        self._current_icon = None
+        self._install_trigger()
         self._dark_mode = self._config.get("ui", {}).get("dark_mode", False)
 
-        ThemeManager.apply(self._dark_mode)
+        # Applying the stylesheet re-polishes every widget; defer it to the
+        # first event loop turn so the tray icon shows up first
+        QTimer.singleShot(0, lambda: theme.apply(self._dark_mode))
 
         self._setup_tray()
         self._setup_timer()
@@ -79,6 +113,8 @@ class FakerApp(QObject):
     def _setup_timer(self):
         """Set up the activity trigger timer."""
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(False)
         self._timer.timeout.connect(self._trigger_activity)
 
     def _toggle(self):
@@ -102,44 +138,79 @@ class FakerApp(QObject):
             return
 
         self._active = True
-        interval_ms = self._config.get("interval_seconds", 60) * 1000
-        self._timer.start(interval_ms)
+        if method == "idle_reset" and set_keep_awake(True):
+            # The OS keeps the idle timers reset; no periodic wakeups needed
+            self._keeping_awake = True
+        else:
+            self._interval = self._config.get("interval_seconds", 60)
+            self._timer.start(self._interval * 1000)
         self._toggle_action.setText("Pause")
         self._update_tray_icon()
         self._update_tooltip()
 
         self._config["enabled"] = True
-        save_config(self._config)
+        save_config_async(self._config)
 
     def _stop(self):
         """Stop simulating activity."""
         self._active = False
         self._timer.stop()
+        if self._keeping_awake:
+            set_keep_awake(False)
+            self._keeping_awake = False
+        self._interval = self._config.get("interval_seconds", 60)
+        self._last_fire = 0.0
         self._toggle_action.setText("Start")
         self._update_tray_icon()
         self._update_tooltip()
 
         self._config["enabled"] = False
-        save_config(self._config)
+        save_config_async(self._config)
 
-    def _trigger_activity(self):
-        """Execute the configured activity simulation method."""
+    def _install_trigger(self):
+        """Bind the configured activity method and its arguments.
+
+        Resolved once per config change so each timer tick is a single
+        call instead of a walk through the config dict.
+        """
         method = self._config.get("method", "keyboard")
 
         if method == "keyboard":
             key = self._config.get("keyboard", {}).get("key", "F15")
-            send_key(key)
+            self._trigger_fn = partial(send_key, key)
         elif method == "mouse":
             mode = self._config.get("mouse", {}).get("mode", "fixed")
             if mode == "random":
-                move_mouse_random()
+                self._trigger_fn = move_mouse_random
             else:
                 pixels = self._config.get("mouse", {}).get("pixels", 1)
-                move_mouse_fixed(pixels)
+                self._trigger_fn = partial(move_mouse_fixed, pixels)
         elif method == "scroll_lock":
-            toggle_scroll_lock()
+            self._trigger_fn = toggle_scroll_lock
         elif method == "idle_reset":
-            reset_idle_timer()
+            self._trigger_fn = reset_idle_timer
+        else:
+            self._trigger_fn = None
+
+    def _trigger_activity(self):
+        """Execute the configured activity simulation method.
+
+        The call runs on QThreadPool so a slow or hung backend (e.g. an
+        xdotool subprocess waiting on its timeout) never blocks the GUI
+        thread. Ticks that fire while a previous job is still running are
+        dropped rather than queued, as are ticks arriving well before the
+        interval has elapsed (e.g. a burst of missed ticks delivered at
+        once after resuming from sleep).
+        """
+        now = time.monotonic()
+        if now - self._last_fire < self._interval * 0.9:
+            return
+        self._last_fire = now
+
+        fn = self._trigger_fn
+        if fn is None or not self._activity_busy.acquire(blocking=False):
+            return
+        QThreadPool.globalInstance().start(_ActivityJob(fn, self._activity_busy))
 
     def _show_options(self):
         """Show the options dialog."""
@@ -147,12 +218,19 @@ class FakerApp(QObject):
         if was_active:
             self._stop()
 
-        dialog = OptionsDialog(self._config)
-        if dialog.exec():
-            self._config = dialog.get_config()
+        if self._options_dialog is None:
+            # Imported on first use; most sessions never open the dialog
+            from .options import OptionsDialog
+            self._options_dialog = OptionsDialog(self._config)
+        else:
+            self._options_dialog.reload(self._config)
+
+        if self._options_dialog.exec():
+            self._config = self._options_dialog.get_config()
             # Preserve UI and enabled state
             self._config.setdefault("ui", {})["dark_mode"] = self._dark_mode
-            save_config(self._config)
+            save_config_async(self._config)
+            self._install_trigger()
             self._update_tooltip()
 
         if was_active:
@@ -161,7 +239,7 @@ class FakerApp(QObject):
     def _toggle_dark_mode(self):
         """Toggle between dark and light mode."""
         self._dark_mode = not self._dark_mode
-        ThemeManager.apply(self._dark_mode)
+        theme.apply(self._dark_mode)
         self._update_tray_icon()
 
         self._dark_mode_action.setText(
@@ -169,7 +247,7 @@ class FakerApp(QObject):
         )
 
         self._config.setdefault("ui", {})["dark_mode"] = self._dark_mode
-        save_config(self._config)
+        save_config_async(self._config)
 
     def _update_tray_icon(self):
         """Update the tray icon to reflect the current state."""
@@ -177,6 +255,10 @@ class FakerApp(QObject):
             active=self._active,
             dark_mode=self._dark_mode,
         )
+        # Icons are cached, so an identical object means nothing changed
+        if icon is self._current_icon:
+            return
+        self._current_icon = icon
         self.tray_icon.setIcon(icon)
 
     def _update_tooltip(self):
@@ -184,6 +266,9 @@ class FakerApp(QObject):
         if self._active:
             method = self._config.get("method", "keyboard")
             label = METHODS.get(method, {}).get("label", method)
+            if self._keeping_awake:
+                self.tray_icon.setToolTip(f"Faker - Active\n{label}")
+                return
             interval = self._config.get("interval_seconds", 60)
             self.tray_icon.setToolTip(
                 f"Faker - Active\n{label} every {interval}s"
@@ -191,6 +276,10 @@ class FakerApp(QObject):
         else:
             self.tray_icon.setToolTip("Faker - Paused")
 
+    def _save_on_quit(self):
+        """Write any pending config change before the application exits."""
+        save_config(self._config)
+
     def _exit_app(self):
         """Exit the application."""
         self.tray_icon.hide()
@@ -1,19 +1,25 @@
 """Activity simulation methods.
 
 Cross-platform support:
-  - Linux: uses xdotool for input simulation, xdg-screensaver for idle reset.
-    System requirement: xdotool (sudo apt install xdotool)
+  - Linux: uses libxdo via ctypes for input simulation (falling back to the
+    xdotool command when the library is missing), xdg-screensaver for idle
+    reset. System requirement: xdotool (sudo apt install xdotool)
+    Alternatively a uinput backend writes events straight to a virtual
+    kernel input device, bypassing X11 (works on Wayland, needs write
+    access to /dev/uinput).
   - Windows: uses SendInput via ctypes for input, SetThreadExecutionState
     for idle reset. No external tools required.
 """
 
 import random
-import shutil
-import subprocess
 import sys
 
 IS_WINDOWS = sys.platform == "win32"
 
+LINUX_BACKENDS = ("uinput", "xdo", "xdotool")
+
+_linux_backend = "xdo"
+
 
 # ── Windows backend (ctypes) ─────────────────────────────────
 
@@ -37,6 +43,7 @@ if IS_WINDOWS:
     # SetThreadExecutionState flags
     _ES_SYSTEM_REQUIRED = 0x00000001
     _ES_DISPLAY_REQUIRED = 0x00000002
+    _ES_CONTINUOUS = 0x80000000
 
     # Virtual key code mapping from config key names
     _VK_MAP = {
@@ -50,6 +57,8 @@ if IS_WINDOWS:
         "Num_Lock": 0x90,
     }
 
+    _VK_SCROLL_LOCK = _VK_MAP["Scroll_Lock"]
+
     class _KEYBDINPUT(ctypes.Structure):
         _fields_ = [
             ("wVk", wintypes.WORD),
@@ -89,44 +98,254 @@ if IS_WINDOWS:
             ("union", _INPUT_UNION),
         ]
 
-    def _win_send_input(*inputs):
-        n = len(inputs)
-        arr = (_INPUT * n)(*inputs)
-        return user32.SendInput(n, arr, ctypes.sizeof(_INPUT))
+    # Bind prototypes once so calls skip the DLL attribute lookup and
+    # ctypes' generic argument conversion
+    _SendInput = user32.SendInput
+    _SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _SendInput.restype = wintypes.UINT
 
-    def _win_key_press(vk: int) -> bool:
-        """Send a key down + key up via SendInput."""
-        down = _INPUT()
-        down.type = _INPUT_KEYBOARD
-        down.union.ki.wVk = vk
+    _SetThreadExecutionState = kernel32.SetThreadExecutionState
+    _SetThreadExecutionState.argtypes = [wintypes.DWORD]
+    _SetThreadExecutionState.restype = wintypes.DWORD
+
+    _INPUT_SIZE = ctypes.sizeof(_INPUT)
 
-        up = _INPUT()
-        up.type = _INPUT_KEYBOARD
-        up.union.ki.wVk = vk
-        up.union.ki.dwFlags = _KEYEVENTF_KEYUP
+    # Reusable event buffers; only wVk / dx / dy change between calls
+    _KEY_BUF = (_INPUT * 2)()
+    _KEY_BUF[0].type = _INPUT_KEYBOARD
+    _KEY_BUF[1].type = _INPUT_KEYBOARD
+    _KEY_BUF[1].union.ki.dwFlags = _KEYEVENTF_KEYUP
 
-        return _win_send_input(down, up) == 2
+    _MOUSE_BUF = (_INPUT * 2)()
+    _MOUSE_BUF[0].type = _INPUT_MOUSE
+    _MOUSE_BUF[0].union.mi.dwFlags = _MOUSEEVENTF_MOVE
+    _MOUSE_BUF[1].type = _INPUT_MOUSE
+    _MOUSE_BUF[1].union.mi.dwFlags = _MOUSEEVENTF_MOVE
+
+    def _win_key_press(vk: int) -> bool:
+        """Send a key down + key up via SendInput."""
+        _KEY_BUF[0].union.ki.wVk = vk
+        _KEY_BUF[1].union.ki.wVk = vk
+        return _SendInput(2, _KEY_BUF, _INPUT_SIZE) == 2
 
     def _win_mouse_move(dx: int, dy: int) -> bool:
         """Send a relative mouse move via SendInput."""
-        move = _INPUT()
-        move.type = _INPUT_MOUSE
-        move.union.mi.dx = dx
-        move.union.mi.dy = dy
-        move.union.mi.dwFlags = _MOUSEEVENTF_MOVE
+        _MOUSE_BUF[0].union.mi.dx = dx
+        _MOUSE_BUF[0].union.mi.dy = dy
+        return _SendInput(1, _MOUSE_BUF, _INPUT_SIZE) == 1
 
-        return _win_send_input(move) == 1
+    def _win_mouse_move_and_back(pixels: int) -> bool:
+        """Move right by N pixels and back left again in one SendInput."""
+        _MOUSE_BUF[0].union.mi.dx = pixels
+        _MOUSE_BUF[0].union.mi.dy = 0
+        _MOUSE_BUF[1].union.mi.dx = -pixels
+        _MOUSE_BUF[1].union.mi.dy = 0
+        return _SendInput(2, _MOUSE_BUF, _INPUT_SIZE) == 2
 
 
-# ── Linux backend (xdotool / xdg-screensaver) ────────────────
+# ── Linux backend (libxdo / xdotool / xdg-screensaver) ───────
+
+if not IS_WINDOWS:
+    import ctypes
+    import shutil
+    import subprocess
+
+    # xdo.h: a window of 0 targets whichever window currently has focus
+    _CURRENTWINDOW = 0
+
+    # Delay between keystrokes in microseconds (xdotool's default is 12 ms)
+    _XDO_KEY_DELAY_US = 12000
+
+    def _load_xdo():
+        """Load libxdo and open an X connection once.
+
+        Returns (library, xdo_t handle), or (None, None) if libxdo is not
+        installed or no X display is available.
+        """
+        try:
+            lib = ctypes.CDLL("libxdo.so.3")
+        except OSError:
+            return None, None
+
+        lib.xdo_new.argtypes = [ctypes.c_char_p]
+        lib.xdo_new.restype = ctypes.c_void_p
+        lib.xdo_send_keysequence_window.argtypes = [
+            ctypes.c_void_p,   # const xdo_t *xdo
+            ctypes.c_ulong,    # Window window
+            ctypes.c_char_p,   # const char *keysequence
+            ctypes.c_uint,     # useconds_t delay
+        ]
+        lib.xdo_send_keysequence_window.restype = ctypes.c_int
+        lib.xdo_move_mouse_relative.argtypes = [
+            ctypes.c_void_p,   # const xdo_t *xdo
+            ctypes.c_int,      # int x
+            ctypes.c_int,      # int y
+        ]
+        lib.xdo_move_mouse_relative.restype = ctypes.c_int
+
+        handle = lib.xdo_new(None)
+        if not handle:
+            return None, None
+        return lib, handle
+
+    _xdo, _XDO = _load_xdo()
+
+    def _xdo_key_press(key: str) -> bool:
+        """Send a key down + key up via libxdo."""
+        return _xdo.xdo_send_keysequence_window(
+            _XDO, _CURRENTWINDOW, key.encode(), _XDO_KEY_DELAY_US
+        ) == 0
+
+    def _xdo_mouse_move(dx: int, dy: int) -> bool:
+        """Send a relative mouse move via libxdo."""
+        return _xdo.xdo_move_mouse_relative(_XDO, dx, dy) == 0
+
+    # ── uinput backend ──
+
+    import fcntl
+    import os
+    import struct
+
+    # linux/input-event-codes.h
+    _EV_SYN = 0x00
+    _EV_KEY = 0x01
+    _EV_REL = 0x02
+    _SYN_REPORT = 0x00
+    _REL_X = 0x00
+    _REL_Y = 0x01
+    _BTN_LEFT = 0x110
+    _BUS_VIRTUAL = 0x06
+
+    # linux/uinput.h ioctl requests
+    _UI_DEV_CREATE = 0x5501
+    _UI_DEV_SETUP = 0x405C5503
+    _UI_SET_EVBIT = 0x40045564
+    _UI_SET_KEYBIT = 0x40045565
+    _UI_SET_RELBIT = 0x40045566
+
+    # struct input_event { struct timeval time; u16 type; u16 code; s32 value; }
+    _INPUT_EVENT = struct.Struct("llHHi")
+
+    # struct uinput_setup { struct input_id id; char name[80]; u32 ff_effects_max; }
+    _UINPUT_SETUP = struct.Struct("HHHH80sI")
+
+    # Linux key code mapping from config key names
+    _KEYCODE_MAP = {
+        "F1": 59, "F2": 60, "F3": 61, "F4": 62,
+        "F5": 63, "F6": 64, "F7": 65, "F8": 66,
+        "F9": 67, "F10": 68, "F11": 87, "F12": 88,
+        "F13": 183, "F14": 184, "F15": 185, "F16": 186,
+        "F17": 187, "F18": 188, "F19": 189, "F20": 190,
+        "F21": 191, "F22": 192, "F23": 193, "F24": 194,
+        "Scroll_Lock": 70,
+        "Num_Lock": 69,
+    }
+
+    def _input_event(ev_type: int, code: int, value: int) -> bytes:
+        # The kernel timestamps uinput events itself, so time is left zero
+        return _INPUT_EVENT.pack(0, 0, ev_type, code, value)
+
+    _SYN = _input_event(_EV_SYN, _SYN_REPORT, 0)
+
+    class _UInputBackend:
+        """Virtual keyboard + mouse device created through /dev/uinput.
+
+        Each simulated action is packed into a single buffer of
+        input_event structs and handed to the kernel with one write().
+        """
+
+        def __init__(self):
+            fd = os.open("/dev/uinput", os.O_WRONLY | os.O_NONBLOCK)
+            try:
+                for ev_type in (_EV_SYN, _EV_KEY, _EV_REL):
+                    fcntl.ioctl(fd, _UI_SET_EVBIT, ev_type)
+                for code in _KEYCODE_MAP.values():
+                    fcntl.ioctl(fd, _UI_SET_KEYBIT, code)
+                # A button is needed for the device to be classified as a pointer
+                fcntl.ioctl(fd, _UI_SET_KEYBIT, _BTN_LEFT)
+                fcntl.ioctl(fd, _UI_SET_RELBIT, _REL_X)
+                fcntl.ioctl(fd, _UI_SET_RELBIT, _REL_Y)
+                fcntl.ioctl(fd, _UI_DEV_SETUP, _UINPUT_SETUP.pack(
+                    _BUS_VIRTUAL, 0, 0, 1, b"Faker virtual input", 0,
+                ))
+                fcntl.ioctl(fd, _UI_DEV_CREATE)
+            except OSError:
+                os.close(fd)
+                raise
+            self._fd = fd
+
+            # Prebuilt down + up sequences for every supported key
+            self._key_events = {
+                key: (
+                    _input_event(_EV_KEY, code, 1) + _SYN
+                    + _input_event(_EV_KEY, code, 0) + _SYN
+                )
+                for key, code in _KEYCODE_MAP.items()
+            }
+
+        def _write(self, events: bytes) -> bool:
+            try:
+                return os.write(self._fd, events) == len(events)
+            except OSError:
+                return False
+
+        def key_press(self, key: str) -> bool:
+            """Send a key down + key up."""
+            events = self._key_events.get(key)
+            if events is None:
+                return False
+            return self._write(events)
+
+        def mouse_move(self, dx: int, dy: int) -> bool:
+            """Send a relative mouse move."""
+            return self._write(
+                _input_event(_EV_REL, _REL_X, dx)
+                + _input_event(_EV_REL, _REL_Y, dy)
+                + _SYN
+            )
+
+        def mouse_move_and_back(self, pixels: int) -> bool:
+            """Move right by N pixels and back left again in one write."""
+            return self._write(
+                _input_event(_EV_REL, _REL_X, pixels) + _SYN
+                + _input_event(_EV_REL, _REL_X, -pixels) + _SYN
+            )
+
+    _uinput = None
+    # Set when opening /dev/uinput failed, so ticks don't retry it
+    _uinput_failed = False
+
+    def _get_uinput():
+        """Return the shared uinput device, or None if it can't be created.
+
+        set_linux_backend() creates the device up front: events written
+        right after UI_DEV_CREATE are dropped until udev and the display
+        server have opened the new device node.
+        """
+        global _uinput, _uinput_failed
+        if _uinput is None and not _uinput_failed:
+            try:
+                _uinput = _UInputBackend()
+            except OSError:
+                _uinput_failed = True
+        return _uinput
+
+    def _use_xdo() -> bool:
+        """Whether the libxdo backend is selected and loaded."""
+        return _linux_backend == "xdo" and _XDO is not None
+
 
 def _run(args: list[str]) -> bool:
-    """Run a subprocess command, returning True on success."""
+    """Run a subprocess command, returning True on success.
+
+    Used for xdg-screensaver, and for xdotool when libxdo is unavailable.
+    """
     try:
         subprocess.run(
             args,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
         return True
@@ -134,6 +353,23 @@ def _run(args: list[str]) -> bool:
         return False
 
 
+_xdotool_path = None
+
+
+def _run_xdotool(args: list[str]) -> bool:
+    """Run xdotool with args, returning True on success.
+
+    The executable path is resolved once, so each spawn execs it directly
+    instead of searching PATH.
+    """
+    global _xdotool_path
+    if _xdotool_path is None:
+        _xdotool_path = shutil.which("xdotool")
+        if _xdotool_path is None:
+            return False
+    return _run([_xdotool_path, *args])
+
+
 # ── Tool availability checks ─────────────────────────────────
 
 def check_requirements(method: str) -> str | None:
@@ -146,11 +382,20 @@ def check_requirements(method: str) -> str | None:
         return None  # ctypes always available
 
     if method in ("keyboard", "mouse", "scroll_lock"):
-        if not shutil.which("xdotool"):
-            return (
-                "xdotool is required but not installed.\n"
-                "Install it with: sudo apt install xdotool"
-            )
+        if _linux_backend == "uinput":
+            if not os.access("/dev/uinput", os.W_OK):
+                return (
+                    "Write access to /dev/uinput is required for the "
+                    "uinput backend.\n"
+                    "Add your user to the 'input' group or install a udev "
+                    "rule granting access."
+                )
+        elif _linux_backend == "xdotool" or _XDO is None:
+            if not shutil.which("xdotool"):
+                return (
+                    "xdotool is required but not installed.\n"
+                    "Install it with: sudo apt install xdotool"
+                )
     elif method == "idle_reset":
         if not shutil.which("xdg-screensaver"):
             return (
@@ -162,12 +407,31 @@ def check_requirements(method: str) -> str | None:
 
 # ── Public API (cross-platform) ───────────────────────────────
 
+def set_linux_backend(name: str) -> None:
+    """Select the Linux input backend.
+
+    Args:
+        name: One of LINUX_BACKENDS. "xdo" uses libxdo and falls back to
+              the xdotool command if the library is unavailable; unknown
+              names are treated as "xdo". Selecting "uinput" creates
+              the virtual device immediately. Ignored on Windows.
+    """
+    global _linux_backend, _uinput_failed
+    _linux_backend = name if name in LINUX_BACKENDS else "xdo"
+    if _linux_backend == "uinput" and not IS_WINDOWS:
+        # Register the virtual device well before the first tick writes to
+        # it; selecting the backend again retries a failed open
+        _uinput_failed = False
+        _get_uinput()
+
+
 def send_key(key: str = "F15") -> bool:
     """Simulate a key press and release.
 
     Args:
         key: Key name (e.g. F15, F13, Scroll_Lock).
-             On Linux these are X11 key names passed to xdotool.
+             On Linux these are X11 key names passed to libxdo/xdotool
+             (the uinput backend supports F1-F24, Scroll_Lock, Num_Lock).
              On Windows they are mapped to virtual key codes.
     """
     if IS_WINDOWS:
@@ -175,7 +439,12 @@ def send_key(key: str = "F15") -> bool:
         if vk is None:
             return False
         return _win_key_press(vk)
-    return _run(["xdotool", "key", key])
+    if _linux_backend == "uinput":
+        dev = _get_uinput()
+        return dev is not None and dev.key_press(key)
+    if _use_xdo():
+        return _xdo_key_press(key)
+    return _run_xdotool(["key", key])
 
 
 def move_mouse_fixed(pixels: int = 1) -> bool:
@@ -185,14 +454,20 @@ def move_mouse_fixed(pixels: int = 1) -> bool:
     so the cursor ends up in the same position.
     """
     if IS_WINDOWS:
-        ok = _win_mouse_move(pixels, 0)
+        return _win_mouse_move_and_back(pixels)
+    if _linux_backend == "uinput":
+        dev = _get_uinput()
+        return dev is not None and dev.mouse_move_and_back(pixels)
+    if _use_xdo():
+        ok = _xdo_mouse_move(pixels, 0)
         if ok:
-            ok = _win_mouse_move(-pixels, 0)
+            ok = _xdo_mouse_move(-pixels, 0)
         return ok
-    ok = _run(["xdotool", "mousemove_relative", "--", str(pixels), "0"])
-    if ok:
-        ok = _run(["xdotool", "mousemove_relative", "--", str(-pixels), "0"])
-    return ok
+    # Chain both moves into a single xdotool invocation
+    return _run_xdotool([
+        "mousemove_relative", "--", str(pixels), "0",
+        "mousemove_relative", "--", str(-pixels), "0",
+    ])
 
 
 def move_mouse_random() -> bool:
@@ -207,7 +482,12 @@ def move_mouse_random() -> bool:
         x = 1
     if IS_WINDOWS:
         return _win_mouse_move(x, y)
-    return _run(["xdotool", "mousemove_relative", "--", str(x), str(y)])
+    if _linux_backend == "uinput":
+        dev = _get_uinput()
+        return dev is not None and dev.mouse_move(x, y)
+    if _use_xdo():
+        return _xdo_mouse_move(x, y)
+    return _run_xdotool(["mousemove_relative", "--", str(x), str(y)])
 
 
 def toggle_scroll_lock() -> bool:
@@ -217,14 +497,24 @@ def toggle_scroll_lock() -> bool:
     This is invisible to most applications but registers as user activity.
     """
     if IS_WINDOWS:
-        ok = _win_key_press(_VK_MAP["Scroll_Lock"])
+        ok = _win_key_press(_VK_SCROLL_LOCK)
+        if ok:
+            ok = _win_key_press(_VK_SCROLL_LOCK)
+        return ok
+    if _linux_backend == "uinput":
+        dev = _get_uinput()
+        if dev is None:
+            return False
+        ok = dev.key_press("Scroll_Lock")
+        if ok:
+            ok = dev.key_press("Scroll_Lock")
+        return ok
+    if _use_xdo():
+        ok = _xdo_key_press("Scroll_Lock")
         if ok:
-            ok = _win_key_press(_VK_MAP["Scroll_Lock"])
+            ok = _xdo_key_press("Scroll_Lock")
         return ok
-    ok = _run(["xdotool", "key", "Scroll_Lock"])
-    if ok:
-        ok = _run(["xdotool", "key", "Scroll_Lock"])
-    return ok
+    return _run_xdotool(["key", "Scroll_Lock", "Scroll_Lock"])
 
 
 def reset_idle_timer() -> bool:
@@ -238,13 +528,33 @@ def reset_idle_timer() -> bool:
     sleep and system sleep.
     """
     if IS_WINDOWS:
-        result = kernel32.SetThreadExecutionState(
+        result = _SetThreadExecutionState(
             _ES_DISPLAY_REQUIRED | _ES_SYSTEM_REQUIRED
         )
         return result != 0
     return _run(["xdg-screensaver", "reset"])
 
 
+def set_keep_awake(enabled: bool) -> bool:
+    """Hold the display and system awake until released.
+
+    On Windows: calls SetThreadExecutionState with ES_CONTINUOUS, which
+    keeps ES_DISPLAY_REQUIRED and ES_SYSTEM_REQUIRED in effect until the
+    flags are cleared, with no periodic calls needed. The state belongs to
+    the calling thread, so call this from a long-lived thread (the GUI
+    thread). Passing enabled=False clears the flags.
+
+    On Linux there is no equivalent; returns False so the caller can fall
+    back to calling reset_idle_timer() periodically.
+    """
+    if IS_WINDOWS:
+        flags = _ES_CONTINUOUS
+        if enabled:
+            flags |= _ES_DISPLAY_REQUIRED | _ES_SYSTEM_REQUIRED
+        return _SetThreadExecutionState(flags) != 0
+    return False
+
+
 # ── Method registry ───────────────────────────────────────────
 
 METHODS = {
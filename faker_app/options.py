@@ -15,7 +15,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 
 from .methods import METHODS
-from .utils.theme import ThemeManager
+from .utils import theme
 
 
 class OptionsDialog(QDialog):
@@ -28,6 +28,7 @@ class OptionsDialog(QDialog):
         self.setModal(True)
 
         self._config = config
+        self._method_radios: dict[str, QRadioButton] = {}
 
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(12)
@@ -39,7 +40,6 @@ class OptionsDialog(QDialog):
         self._interval_spin = QSpinBox()
         self._interval_spin.setRange(1, 3600)
         self._interval_spin.setSuffix(" seconds")
-        self._interval_spin.setValue(config.get("interval_seconds", 60))
         general_layout.addWidget(self._interval_spin)
         general_layout.addStretch()
         general_group.setLayout(general_layout)
@@ -50,12 +50,12 @@ class OptionsDialog(QDialog):
         method_layout = QVBoxLayout()
         self._method_button_group = QButtonGroup(self)
 
-        current_method = config.get("method", "keyboard")
         for i, (method_id, info) in enumerate(METHODS.items()):
             radio = QRadioButton(info["label"])
             radio.setToolTip(info["description"])
             radio.setProperty("method_id", method_id)
             self._method_button_group.addButton(radio, i)
+            self._method_radios[method_id] = radio
             method_layout.addWidget(radio)
 
             # Description label (smaller, dimmed)
@@ -64,9 +64,6 @@ class OptionsDialog(QDialog):
             desc.setStyleSheet("font-size: 11px; color: #888888; margin-left: 22px;")
             method_layout.addWidget(desc)
 
-            if method_id == current_method:
-                radio.setChecked(True)
-
         method_group.setLayout(method_layout)
         main_layout.addWidget(method_group)
 
@@ -79,8 +76,6 @@ class OptionsDialog(QDialog):
         self._key_combo.addItems([
             "F13", "F14", "F15", "F16", "F17", "F18", "F19", "F20",
         ])
-        current_key = config.get("keyboard", {}).get("key", "F15")
-        self._key_combo.setCurrentText(current_key)
         kb_layout.addWidget(self._key_combo)
         kb_layout.addStretch()
         self._keyboard_group.setLayout(kb_layout)
@@ -91,7 +86,6 @@ class OptionsDialog(QDialog):
         mouse_layout = QVBoxLayout()
 
         self._mouse_mode_group = QButtonGroup(self)
-        mouse_mode = config.get("mouse", {}).get("mode", "fixed")
 
         # Fixed offset option with pixels spinner
         fixed_row = QHBoxLayout()
@@ -101,7 +95,6 @@ class OptionsDialog(QDialog):
         fixed_row.addWidget(QLabel("Pixels:"))
         self._pixels_spin = QSpinBox()
         self._pixels_spin.setRange(1, 100)
-        self._pixels_spin.setValue(config.get("mouse", {}).get("pixels", 1))
         fixed_row.addWidget(self._pixels_spin)
         fixed_row.addStretch()
         mouse_layout.addLayout(fixed_row)
@@ -111,11 +104,6 @@ class OptionsDialog(QDialog):
         self._mouse_mode_group.addButton(self._mouse_random_radio, 1)
         mouse_layout.addWidget(self._mouse_random_radio)
 
-        if mouse_mode == "random":
-            self._mouse_random_radio.setChecked(True)
-        else:
-            self._mouse_fixed_radio.setChecked(True)
-
         self._mouse_group.setLayout(mouse_layout)
         main_layout.addWidget(self._mouse_group)
 
@@ -130,7 +118,7 @@ class OptionsDialog(QDialog):
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(ThemeManager.accent_button_style())
+        save_btn.setStyleSheet(theme.accent_button_style())
         save_btn.clicked.connect(self.accept)
         button_layout.addWidget(save_btn)
 
@@ -138,10 +126,37 @@ class OptionsDialog(QDialog):
 
         # Connect method change to show/hide options
         self._method_button_group.buttonClicked.connect(self._on_method_changed)
-        self._on_method_changed()
 
         # Connect mouse mode to enable/disable pixels spinner
         self._mouse_fixed_radio.toggled.connect(self._on_mouse_mode_changed)
+
+        self.reload(config)
+
+    def reload(self, config: dict) -> None:
+        """Refresh the widgets from config without rebuilding them.
+
+        Lets a single dialog instance be reused across opens.
+        """
+        self._config = config
+
+        self._interval_spin.setValue(config.get("interval_seconds", 60))
+
+        radio = self._method_radios.get(config.get("method", "keyboard"))
+        if radio:
+            radio.setChecked(True)
+
+        self._key_combo.setCurrentText(
+            config.get("keyboard", {}).get("key", "F15")
+        )
+
+        mouse = config.get("mouse", {})
+        self._pixels_spin.setValue(mouse.get("pixels", 1))
+        if mouse.get("mode", "fixed") == "random":
+            self._mouse_random_radio.setChecked(True)
+        else:
+            self._mouse_fixed_radio.setChecked(True)
+
+        self._on_method_changed()
         self._on_mouse_mode_changed()
 
     def _on_method_changed(self, _btn=None):
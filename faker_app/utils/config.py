@@ -1,8 +1,11 @@
 """Configuration management for Faker."""
 
+import copy
 import json
 from pathlib import Path
 
+from PyQt6.QtCore import QThreadPool, QTimer
+
 CONFIG_DIR = Path.home() / ".config" / "faker"
 CONFIG_FILE = CONFIG_DIR / "settings.json"
 
@@ -10,6 +13,7 @@ DEFAULT_CONFIG = {
     "method": "keyboard",
     "interval_seconds": 60,
     "enabled": False,
+    "linux_backend": "xdo",
     "keyboard": {
         "key": "F15",
     },
@@ -22,6 +26,32 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Delay before a save_config_async() request is written to disk; further
+# requests within this window are coalesced into a single write.
+SAVE_DELAY_MS = 500
+
+# Single-threaded pool so background writes land on disk in order
+_writer = QThreadPool()
+_writer.setMaxThreadCount(1)
+
+_pending: dict | None = None
+_save_timer: QTimer | None = None
+
+# Copy of what is currently on disk, used to skip no-op writes
+_last_written: dict | None = None
+
+
+def _copy_defaults() -> dict:
+    """Return an independent copy of DEFAULT_CONFIG.
+
+    The defaults are only two levels deep, so copying each nested dict is
+    enough and skips deepcopy's memo bookkeeping.
+    """
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in DEFAULT_CONFIG.items()
+    }
+
 
 def _deep_merge(base: dict, overlay: dict) -> None:
     """Recursively merge overlay into base dict."""
@@ -32,24 +62,85 @@ def _deep_merge(base: dict, overlay: dict) -> None:
             base[key] = value
 
 
+def _has_all_keys(config: dict, defaults: dict) -> bool:
+    """Check that config has every key in defaults, at every nesting level."""
+    if not isinstance(config, dict) or not config.keys() >= defaults.keys():
+        return False
+    return all(
+        _has_all_keys(config[key], value)
+        for key, value in defaults.items()
+        if isinstance(value, dict)
+    )
+
+
 def load_config() -> dict:
     """Load configuration from disk, merging with defaults for any missing keys."""
+    global _last_written
     if not CONFIG_FILE.exists():
         save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG.copy()
+        return _copy_defaults()
 
     try:
         with open(CONFIG_FILE, "r") as f:
             config = json.load(f)
-        merged = json.loads(json.dumps(DEFAULT_CONFIG))  # deep copy
+        _last_written = copy.deepcopy(config)
+        # Files written by save_config already carry the full schema
+        if _has_all_keys(config, DEFAULT_CONFIG):
+            return config
+        merged = _copy_defaults()
         _deep_merge(merged, config)
         return merged
     except (json.JSONDecodeError, IOError):
-        return DEFAULT_CONFIG.copy()
+        return _copy_defaults()
 
 
-def save_config(config: dict) -> None:
-    """Save configuration to disk."""
+def _write_config(config: dict) -> None:
+    global _last_written
+    if config == _last_written:
+        return
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    # Compact separators keep json on its C encoder (indent forces the
+    # pure-Python one) and shrink the file
     with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+        f.write(json.dumps(config, separators=(",", ":")))
+    _last_written = copy.deepcopy(config)
+
+
+def _flush_pending() -> None:
+    """Hand the latest pending config to the background writer."""
+    global _pending
+    if _pending is None:
+        return
+    snapshot = copy.deepcopy(_pending)
+    _pending = None
+    _writer.start(lambda: _write_config(snapshot))
+
+
+def save_config(config: dict) -> None:
+    """Save configuration to disk immediately.
+
+    Any write queued by save_config_async() is discarded and in-flight
+    background writes are waited for, so an older snapshot can never
+    overwrite this one.
+    """
+    global _pending
+    _pending = None
+    if _save_timer is not None:
+        _save_timer.stop()
+    _writer.waitForDone()
+    _write_config(config)
+
+
+def save_config_async(config: dict) -> None:
+    """Schedule a debounced save of configuration on a background thread.
+
+    Must be called from the Qt GUI thread. The config is snapshotted when
+    the debounce timer fires, so the most recent state is what gets written.
+    """
+    global _pending, _save_timer
+    _pending = config
+    if _save_timer is None:
+        _save_timer = QTimer()
+        _save_timer.setSingleShot(True)
+        _save_timer.timeout.connect(_flush_pending)
+    _save_timer.start(SAVE_DELAY_MS)
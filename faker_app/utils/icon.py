@@ -1,28 +1,52 @@
 """Icon generation for Faker system tray."""
 
 from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QPixmap, QPainter, QFont, QColor, QIcon, QPen
+from PyQt6.QtGui import QPixmap, QPainter, QFont, QColor, QIcon, QPen, QImage
 
+# Size of the icons pre-rendered into _icon_data by build_icons.py
+PRERENDERED_SIZE = 64
 
-def generate_tray_icon(
-    active: bool = False,
-    dark_mode: bool = False,
-    size: int = 64,
-) -> QIcon:
-    """Generate the system tray icon programmatically.
+try:
+    from ._icon_data import ICON_BYTES as _ICON_BYTES
+except ImportError:  # running from source without a build
+    _ICON_BYTES: dict[tuple[bool, bool], bytes] = {}
 
-    The icon is a square with "F" centered as large as feasible.
-    Background is colored green when active, transparent when paused.
-    Border and text color are chosen to be readable on the taskbar.
+# Rendered icons keyed by (active, dark_mode, size), with dark_mode set to
+# None for active icons since they look the same in both themes. Only a
+# handful of combinations exist, so entries are never evicted.
+_ICON_CACHE: dict[tuple[bool, bool | None, int], QIcon] = {}
 
-    Args:
-        active: Whether activity simulation is currently running.
-        dark_mode: Whether the OS is in dark mode.
-        size: Icon size in pixels.
+# Rasterized "F" glyphs keyed by (color name, size)
+_GLYPH_CACHE: dict[tuple[str, int], QImage] = {}
 
-    Returns:
-        QIcon ready for use as a system tray icon.
-    """
+
+def _glyph_rect(size: int) -> QRect:
+    """Return the rect the border and glyph are drawn into."""
+    margin = max(1, size // 16)
+    return QRect(margin, margin, size - 2 * margin, size - 2 * margin)
+
+
+def _render_glyph(color: QColor, size: int) -> QImage:
+    """Rasterize the "F" centered, as large as feasible, on a transparent image."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+    font_size = max(1, size * 3 // 8)
+    font = QFont("Arial", font_size, QFont.Weight.Bold)
+    painter.setFont(font)
+    painter.setPen(color)
+    painter.drawText(_glyph_rect(size), Qt.AlignmentFlag.AlignCenter, "F")
+
+    painter.end()
+    return image
+
+
+def _paint_tray_pixmap(active: bool, dark_mode: bool, size: int) -> QPixmap:
+    """Paint the tray icon with QPainter."""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -30,8 +54,7 @@ def generate_tray_icon(
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
-    margin = max(1, size // 16)
-    rect = QRect(margin, margin, size - 2 * margin, size - 2 * margin)
+    rect = _glyph_rect(size)
 
     if active:
         bg_color = QColor("#4caf50")  # Material green
@@ -53,13 +76,54 @@ def generate_tray_icon(
     painter.setBrush(Qt.BrushStyle.NoBrush)
     painter.drawRoundedRect(rect, size // 8, size // 8)
 
-    # Draw "F" text centered, as large as feasible
-    font_size = max(1, size * 3 // 8)
-    font = QFont("Arial", font_size, QFont.Weight.Bold)
-    painter.setFont(font)
-    painter.setPen(fg_color)
-    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "F")
+    # Draw the "F" from the glyph cache; text shaping and rasterization
+    # only happen once per color and size
+    glyph_key = (fg_color.name(), size)
+    glyph = _GLYPH_CACHE.get(glyph_key)
+    if glyph is None:
+        glyph = _render_glyph(fg_color, size)
+        _GLYPH_CACHE[glyph_key] = glyph
+    painter.drawImage(0, 0, glyph)
 
     painter.end()
+    return pixmap
+
+
+def generate_tray_icon(
+    active: bool = False,
+    dark_mode: bool = False,
+    size: int = 64,
+) -> QIcon:
+    """Generate the system tray icon programmatically.
+
+    The icon is a square with "F" centered as large as feasible.
+    Background is colored green when active, transparent when paused.
+    Border and text color are chosen to be readable on the taskbar.
+
+    Packaged builds ship the default-size icons as PNG data, which is
+    decoded instead of painted; other sizes, or running from source,
+    use QPainter.
+
+    Args:
+        active: Whether activity simulation is currently running.
+        dark_mode: Whether the OS is in dark mode.
+        size: Icon size in pixels.
+
+    Returns:
+        QIcon ready for use as a system tray icon. Icons are cached, so
+        repeated calls with the same arguments return the same object.
+    """
+    # Active icons are always white on green, regardless of dark_mode
+    key = (active, None if active else dark_mode, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+
+    data = _ICON_BYTES.get((active, dark_mode)) if size == PRERENDERED_SIZE else None
+    pixmap = QPixmap()
+    if data is None or not pixmap.loadFromData(data, "PNG"):
+        pixmap = _paint_tray_pixmap(active, dark_mode, size)
 
-    return QIcon(pixmap)
+    icon = QIcon(pixmap)
+    _ICON_CACHE[key] = icon
+    return icon
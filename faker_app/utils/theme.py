@@ -1,259 +1,173 @@
 """Centralized theme management for Faker.
 
 Adapted from AWS SSO Watcher's theme system, using the same color palette.
+Stylesheets are assembled from faker_app/resources/themes: structure.qss
+holds the color-independent rules shared by both themes, and colors.qss is
+a template of color declarations rendered for each palette on first use.
+
+Theme state lives in module globals, so callers use the module directly:
+``theme.apply(dark)``, ``theme.is_dark_mode()`` and so on.
 """
 
+import functools
+from pathlib import Path
+from string import Template
+
+from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import QApplication
 
+_THEMES_DIR = Path(__file__).resolve().parent.parent / "resources" / "themes"
+
+DARK = True
+LIGHT = False
+
+# Dark palette
+_D_BG = "#1e1e1e"
+_D_BG_ALT = "#252526"
+_D_BG_RAISED = "#2d2d2d"
+_D_BG_INPUT = "#3c3c3c"
+_D_BG_HOVER = "#4c4c4c"
+_D_BORDER = "#3d3d3d"
+_D_FG = "#d4d4d4"
+_D_FG_DIM = "#888888"
+_D_SELECTION = "#264f78"
+_D_ACCENT = "#0078d4"
+
+# Light palette
+_L_BG = "#ffffff"
+_L_BG_ALT = "#f9f9f9"
+_L_BG_RAISED = "#f3f3f3"
+_L_BG_HOVER = "#e5e5e5"
+_L_BORDER = "#d4d4d4"
+_L_FG = "#1e1e1e"
+_L_FG_DIM = "#666666"
+_L_SELECTION = "#cce8ff"
+_L_ACCENT = "#0078d4"
+
+# Template placeholder values per theme, keyed by dark mode
+_PALETTES = {
+    DARK: {
+        "bg": _D_BG,
+        "fg": _D_FG,
+        "fg_dim": _D_FG_DIM,
+        "border": _D_BORDER,
+        "accent": _D_ACCENT,
+        "raised": _D_BG_RAISED,
+        "hover": _D_BG_HOVER,
+        "input_bg": _D_BG_INPUT,
+        "popup_bg": _D_BG_RAISED,
+        "button_bg": _D_BG_INPUT,
+        "button_pressed": _D_BG_RAISED,
+        "selection_fg": _D_FG,
+    },
+    LIGHT: {
+        "bg": _L_BG,
+        "fg": _L_FG,
+        "fg_dim": _L_FG_DIM,
+        "border": _L_BORDER,
+        "accent": _L_ACCENT,
+        "raised": _L_BG_RAISED,
+        "hover": _L_BG_HOVER,
+        "input_bg": _L_BG,
+        "popup_bg": _L_BG,
+        "button_bg": _L_BG_RAISED,
+        "button_pressed": _L_BORDER,
+        "selection_fg": "#ffffff",
+    },
+}
+
+# Accent button QSS per theme, keyed by dark mode
+_ACCENT_STYLES = {
+    dark: (
+        f"background-color: {accent}; color: white; border: none; "
+        "padding: 8px 24px; border-radius: 4px; font-size: 13px; "
+        "font-weight: bold;"
+    )
+    for dark, accent in ((DARK, _D_ACCENT), (LIGHT, _L_ACCENT))
+}
+
+_current_dark: bool = False
+
+# Whether _current_dark's stylesheet is currently set on the application
+_applied: bool = False
 
-class ThemeManager:
-    """Single source of truth for all application theming."""
+# The QApplication, looked up on the first apply() that finds one
+_app: QApplication | None = None
 
-    _dark_mode: bool = False
+# Set while setStyleSheet runs, so style-change handlers can't re-enter apply()
+_applying: bool = False
 
-    # Dark palette
-    _D_BG = "#1e1e1e"
-    _D_BG_ALT = "#252526"
-    _D_BG_RAISED = "#2d2d2d"
-    _D_BG_INPUT = "#3c3c3c"
-    _D_BG_HOVER = "#4c4c4c"
-    _D_BORDER = "#3d3d3d"
-    _D_FG = "#d4d4d4"
-    _D_FG_DIM = "#888888"
-    _D_SELECTION = "#264f78"
-    _D_ACCENT = "#0078d4"
 
-    # Light palette
-    _L_BG = "#ffffff"
-    _L_BG_ALT = "#f9f9f9"
-    _L_BG_RAISED = "#f3f3f3"
-    _L_BG_HOVER = "#e5e5e5"
-    _L_BORDER = "#d4d4d4"
-    _L_FG = "#1e1e1e"
-    _L_FG_DIM = "#666666"
-    _L_SELECTION = "#cce8ff"
-    _L_ACCENT = "#0078d4"
+@functools.cache
+def _read(name: str) -> str:
+    return (_THEMES_DIR / name).read_text(encoding="utf-8")
 
-    DARK_STYLESHEET = f"""
-        QWidget {{
-            background-color: {_D_BG};
-            color: {_D_FG};
-        }}
-        QWidget:focus {{
-            outline: none;
-        }}
-        QMenu {{
-            background-color: {_D_BG_RAISED};
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-        }}
-        QMenu::item:selected {{
-            background-color: {_D_ACCENT};
-        }}
-        QPushButton {{
-            background-color: {_D_BG_INPUT};
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-            padding: 6px 16px;
-            border-radius: 3px;
-            font-size: 13px;
-        }}
-        QPushButton:hover {{
-            background-color: {_D_BG_HOVER};
-        }}
-        QPushButton:pressed {{
-            background-color: {_D_BG_RAISED};
-        }}
-        QPushButton:disabled {{
-            background-color: {_D_BG_RAISED};
-            color: {_D_FG_DIM};
-        }}
-        QLabel {{
-            color: {_D_FG};
-            background: transparent;
-        }}
-        QGroupBox {{
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 8px;
-            font-weight: bold;
-        }}
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 4px;
-        }}
-        QRadioButton {{
-            color: {_D_FG};
-            background: transparent;
-            spacing: 6px;
-        }}
-        QRadioButton::indicator {{
-            width: 14px;
-            height: 14px;
-        }}
-        QSpinBox {{
-            background-color: {_D_BG_INPUT};
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-            padding: 4px 8px;
-            border-radius: 3px;
-        }}
-        QComboBox {{
-            background-color: {_D_BG_INPUT};
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-            padding: 4px 8px;
-            border-radius: 3px;
-        }}
-        QComboBox::drop-down {{
-            border: none;
-        }}
-        QComboBox QAbstractItemView {{
-            background-color: {_D_BG_RAISED};
-            color: {_D_FG};
-            border: 1px solid {_D_BORDER};
-            selection-background-color: {_D_ACCENT};
-        }}
-        QDialog {{
-            background-color: {_D_BG};
-            color: {_D_FG};
-        }}
-        QMessageBox {{
-            background-color: {_D_BG_RAISED};
-            color: {_D_FG};
-        }}
-        QCheckBox {{
-            color: {_D_FG};
-            background: transparent;
-            spacing: 6px;
-        }}
+
+@functools.lru_cache(maxsize=2)
+def stylesheet(dark: bool) -> str:
+    """Return the rendered stylesheet for a mode, building it on first use."""
+    colors = Template(_read("colors.qss"))
+    return _read("structure.qss") + colors.substitute(_PALETTES[bool(dark)])
+
+
+@functools.lru_cache(maxsize=2)
+def palette(dark: bool) -> QPalette:
+    """Return the application palette for a mode.
+
+    Keeps anything painted natively rather than through the stylesheet in
+    the theme's colors.
     """
+    colors = _PALETTES[bool(dark)]
+    pal = QPalette()
+    pal.setColor(QPalette.ColorRole.Window, QColor(colors["bg"]))
+    pal.setColor(QPalette.ColorRole.WindowText, QColor(colors["fg"]))
+    pal.setColor(QPalette.ColorRole.Base, QColor(colors["input_bg"]))
+    pal.setColor(QPalette.ColorRole.Text, QColor(colors["fg"]))
+    pal.setColor(QPalette.ColorRole.Button, QColor(colors["button_bg"]))
+    pal.setColor(QPalette.ColorRole.ButtonText, QColor(colors["fg"]))
+    pal.setColor(QPalette.ColorRole.Highlight, QColor(colors["accent"]))
+    pal.setColor(QPalette.ColorRole.HighlightedText, QColor(colors["selection_fg"]))
+    return pal
+
 
-    LIGHT_STYLESHEET = f"""
-        QWidget {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-        }}
-        QWidget:focus {{
-            outline: none;
-        }}
-        QMenu {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-        }}
-        QMenu::item:selected {{
-            background-color: {_L_ACCENT};
-            color: white;
-        }}
-        QPushButton {{
-            background-color: {_L_BG_RAISED};
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-            padding: 6px 16px;
-            border-radius: 3px;
-            font-size: 13px;
-        }}
-        QPushButton:hover {{
-            background-color: {_L_BG_HOVER};
-        }}
-        QPushButton:pressed {{
-            background-color: {_L_BORDER};
-        }}
-        QPushButton:disabled {{
-            background-color: {_L_BG_RAISED};
-            color: {_L_FG_DIM};
-        }}
-        QLabel {{
-            color: {_L_FG};
-            background: transparent;
-        }}
-        QGroupBox {{
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 8px;
-            font-weight: bold;
-        }}
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 4px;
-        }}
-        QRadioButton {{
-            color: {_L_FG};
-            background: transparent;
-            spacing: 6px;
-        }}
-        QRadioButton::indicator {{
-            width: 14px;
-            height: 14px;
-        }}
-        QSpinBox {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-            padding: 4px 8px;
-            border-radius: 3px;
-        }}
-        QComboBox {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-            padding: 4px 8px;
-            border-radius: 3px;
-        }}
-        QComboBox::drop-down {{
-            border: none;
-        }}
-        QComboBox QAbstractItemView {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-            border: 1px solid {_L_BORDER};
-            selection-background-color: {_L_ACCENT};
-            selection-color: #ffffff;
-        }}
-        QDialog {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-        }}
-        QMessageBox {{
-            background-color: {_L_BG};
-            color: {_L_FG};
-        }}
-        QCheckBox {{
-            color: {_L_FG};
-            background: transparent;
-            spacing: 6px;
-        }}
+def apply(dark: bool) -> None:
+    """Apply the theme globally and store the current mode.
+
+    Re-applying the mode that is already active is a no-op, since
+    setStyleSheet re-polishes every widget. Code that changes the
+    application stylesheet by other means must call invalidate() first.
     """
+    global _current_dark, _applied, _app, _applying
+    dark = bool(dark)
+    if _applying:
+        return
+    app = _app = _app or QApplication.instance()
+    if app and _applied and _current_dark == dark:
+        return
+    _current_dark = dark
+    if app:
+        _applying = True
+        try:
+            app.setStyleSheet(stylesheet(dark))
+            app.setPalette(palette(dark))
+        finally:
+            _applying = False
+        _applied = True
+
+
+def invalidate() -> None:
+    """Drop cached stylesheets and force the next apply() to run."""
+    global _applied
+    _applied = False
+    _read.cache_clear()
+    stylesheet.cache_clear()
+    palette.cache_clear()
+
 
-    @classmethod
-    def apply(cls, dark: bool) -> None:
-        """Apply the theme globally and store the current mode."""
-        cls._dark_mode = dark
-        app = QApplication.instance()
-        if app:
-            app.setStyleSheet(cls.DARK_STYLESHEET if dark else cls.LIGHT_STYLESHEET)
+def is_dark_mode() -> bool:
+    return _current_dark
 
-    @classmethod
-    def is_dark_mode(cls) -> bool:
-        return cls._dark_mode
 
-    @classmethod
-    def accent_button_style(cls) -> str:
-        """Return QSS for accent-colored buttons (Save, etc.)."""
-        accent = cls._D_ACCENT if cls._dark_mode else cls._L_ACCENT
-        return (
-            f"background-color: {accent}; "
-            f"color: white; "
-            f"border: none; "
-            f"padding: 8px 24px; "
-            f"border-radius: 4px; "
-            f"font-size: 13px; "
-            f"font-weight: bold;"
-        )
+def accent_button_style() -> str:
+    """Return QSS for accent-colored buttons (Save, etc.)."""
+    return _ACCENT_STYLES[bool(_current_dark)]
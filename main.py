@@ -12,10 +12,10 @@ def main():
     app.setOrganizationName("Faker")
     app.setQuitOnLastWindowClosed(False)
 
-    faker = FakerApp()  # noqa: F841 - must keep reference alive
+    FakerApp(app)  # owned by app, which keeps it alive
 
-    sys.exit(app.exec())
+    return app.exec()
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())